@@ -18,64 +18,222 @@ Where:
 import json
 import sys
 import csv
-from collections import defaultdict
-from typing import Dict, List, Set, Tuple, Any
+from collections import defaultdict, deque
+from typing import Dict, List, Set, FrozenSet, Tuple, Any, Iterable, Iterator, Optional
 import hashlib
-from io import StringIO
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import os
+import functools
+from itertools import islice
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    ORJSON_AVAILABLE = False
+    JSONDecodeError = json.JSONDecodeError
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+    # A single parser is reused across rows so its internal buffers are recycled
+    _simdjson_parser = simdjson.Parser()
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Allow arbitrarily large data fields so huge graphs are not rejected
+# (sys.maxsize does not fit in a C long on Windows)
+try:
+    csv.field_size_limit(sys.maxsize)
+except OverflowError:
+    csv.field_size_limit(2**31 - 1)
+
+# Signatures are only bucket keys, so a 128-bit digest is ample
+SIGNATURE_DIGEST_SIZE = 16
+
+# Rows sent to a worker per task, and tasks allowed in flight per worker;
+# together they bound how far reading runs ahead of processing
+ROW_BATCH_SIZE = 64
+MAX_PENDING_BATCHES_PER_WORKER = 2
+
+
+def json_loads(data):
+    """Decode a JSON document, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_project_data(data) -> Dict[str, Any]:
+    """Decode a row's data column, keeping only the fields used for comparison.
+
+    With simdjson the document is parsed lazily and only the fields read by
+    ProjectAnalysis/DependencyGraph are copied into plain Python objects, so
+    large unused subtrees are never materialized.
+    """
+    if not SIMDJSON_AVAILABLE:
+        return json_loads(data)
+
+    doc = _simdjson_parser.parse(data)
+    source_units = []
+    for su in doc.get("SourceUnits", []):
+        build = su.get("Build", {})
+        source_units.append({
+            "Type": su.get("Type", ""),
+            "GraphBreadth": su.get("GraphBreadth", ""),
+            "OriginPaths": list(su.get("OriginPaths", [])),
+            "Build": {
+                "Imports": list(build.get("Imports", [])),
+                "Dependencies": [
+                    {"locator": dep.get("locator", ""), "imports": list(dep.get("imports", []))}
+                    for dep in build.get("Dependencies", [])
+                ],
+                "Succeeded": build.get("Succeeded", False),
+            },
+        })
+    return {"Name": doc.get("Name", ""), "SourceUnits": source_units}
+
+
+def new_signature_hasher():
+    """Create an incremental hasher for signatures, using BLAKE3 when available."""
+    if BLAKE3_AVAILABLE:
+        return blake3()
+    return hashlib.blake2b(digest_size=SIGNATURE_DIGEST_SIZE)
+
+
+def signature_hexdigest(hasher) -> str:
+    """Return the truncated hex digest of a hasher from new_signature_hasher."""
+    if BLAKE3_AVAILABLE:
+        return hasher.hexdigest(length=SIGNATURE_DIGEST_SIZE)
+    return hasher.hexdigest()
+
+
+def _intern(value: Any) -> Any:
+    """Intern string values so repeated locators share a single object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Equal import sets share a single frozenset object within a batch; the table
+# is cleared per batch so worker memory doesn't grow with the whole input
+_FS_INTERN: Dict[FrozenSet[str], FrozenSet[str]] = {}
 
 
 class DependencyGraph:
     """Represents a normalized dependency graph for comparison."""
     
+    __slots__ = (
+        'type', 'graph_breadth', 'origin_paths', 'direct_imports',
+        'dependencies', 'build_succeeded', '_sig', '_canonical',
+    )
+    
     def __init__(self, source_unit: Dict[str, Any]):
-        self.type = source_unit.get("Type", "")
+        self.type = _intern(source_unit.get("Type", ""))
         self.graph_breadth = source_unit.get("GraphBreadth", "")
-        self.build = source_unit.get("Build", {})
         self.origin_paths = source_unit.get("OriginPaths", [])
         
-        # Extract normalized data
-        self.direct_imports = self._normalize_locators(self.build.get("Imports", []))
-        self.dependencies = self._normalize_dependencies(self.build.get("Dependencies", []))
-        self.build_succeeded = self.build.get("Succeeded", False)
+        # Extract normalized data; the raw Build tree is not kept so it can be freed
+        build = source_unit.get("Build", {})
+        self.direct_imports = self._normalize_locators(build.get("Imports", []))
+        self.dependencies = self._normalize_dependencies(build.get("Dependencies", []))
+        self.build_succeeded = build.get("Succeeded", False)
+        
+        # Cached signature and canonical key, computed on first use
+        self._sig = None
+        self._canonical = None
         
     def _normalize_locators(self, locators: List[str]) -> Set[str]:
         """Normalize locators by removing version info if needed for comparison."""
-        return set(sorted(locators))
+        return {_intern(locator) for locator in locators}
     
-    def _normalize_dependencies(self, deps: List[Dict[str, Any]]) -> Dict[str, Set[str]]:
-        """Normalize dependencies to locator -> set of imports mapping."""
+    def _normalize_dependencies(self, deps: List[Dict[str, Any]]) -> Dict[str, FrozenSet[str]]:
+        """Normalize dependencies to locator -> frozenset of imports mapping."""
         normalized = {}
         for dep in deps:
-            locator = dep.get("locator", "")
-            imports = set(dep.get("imports", []))
-            normalized[locator] = imports
+            locator = _intern(dep.get("locator", ""))
+            imports = frozenset(_intern(imp) for imp in dep.get("imports", ()))
+            normalized[locator] = _FS_INTERN.setdefault(imports, imports)
         return normalized
     
     def get_signature(self) -> str:
         """Generate a signature for this dependency graph."""
-        # Create a deterministic representation of the graph
-        data = {
-            "type": self.type,
-            "graph_breadth": self.graph_breadth,
-            "build_succeeded": self.build_succeeded,
-            "direct_imports": sorted(list(self.direct_imports)),
-            "dependencies": {
-                locator: sorted(list(imports)) 
-                for locator, imports in sorted(self.dependencies.items())
-            }
-        }
+        if self._sig is None:
+            self._sig = self._compute_signature()
+        return self._sig
+    
+    def _scalar_fields(self) -> Tuple[str, str]:
+        """Typed text form of graph_breadth and build_succeeded.
         
-        # Convert to JSON string and hash it
-        json_str = json.dumps(data, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(json_str.encode()).hexdigest()
+        repr() keeps null, false, 0 and "0" apart, so the hash and canonical()
+        see exactly the same distinctions.
+        """
+        return repr(self.graph_breadth), repr(self.build_succeeded)
+    
+    def _compute_signature(self) -> str:
+        """Hash a deterministic representation of this dependency graph.
+        
+        Fields are fed to the hash incrementally in sorted order, separated by
+        NUL bytes, with SOH terminating each dependency's import list and STX
+        separating sections. Every value is hashed as its repr() so non-string
+        JSON values (null types, numeric imports) hash and sort like strings
+        while staying distinct from them.
+        """
+        graph_breadth, build_succeeded = self._scalar_fields()
+        h = new_signature_hasher()
+        h.update(repr(self.type).encode())
+        h.update(b'\x00')
+        h.update(graph_breadth.encode())
+        h.update(b'\x00')
+        h.update(build_succeeded.encode())
+        h.update(b'\x02')
+        
+        for locator in sorted(map(repr, self.direct_imports)):
+            h.update(locator.encode())
+            h.update(b'\x00')
+        h.update(b'\x02')
+        
+        dependencies = sorted(
+            (repr(locator), imports) for locator, imports in self.dependencies.items()
+        )
+        for locator, imports in dependencies:
+            h.update(locator.encode())
+            h.update(b'\x00')
+            for imp in sorted(map(repr, imports)):
+                h.update(imp.encode())
+                h.update(b'\x00')
+            h.update(b'\x01')
+        
+        return signature_hexdigest(h)
+    
+    def canonical(self) -> Tuple[Any, ...]:
+        """Return a hashable canonical form of this graph, usable as a dict key."""
+        if self._canonical is None:
+            graph_breadth, build_succeeded = self._scalar_fields()
+            self._canonical = (
+                self.type,
+                graph_breadth,
+                build_succeeded,
+                frozenset(self.direct_imports),
+                frozenset(self.dependencies.items()),
+            )
+        return self._canonical
     
     def is_equivalent_to(self, other: 'DependencyGraph') -> bool:
         """Check if this graph is equivalent to another graph."""
+        # Cheapest discriminators first, full set/dict comparisons last
         return (
+            self.build_succeeded == other.build_succeeded and
             self.type == other.type and
             self.graph_breadth == other.graph_breadth and
-            self.build_succeeded == other.build_succeeded and
+            len(self.direct_imports) == len(other.direct_imports) and
+            len(self.dependencies) == len(other.dependencies) and
             self.direct_imports == other.direct_imports and
             self.dependencies == other.dependencies
         )
@@ -92,6 +250,11 @@ class DependencyGraph:
 class ProjectAnalysis:
     """Represents a complete project analysis with metadata from CSV."""
     
+    __slots__ = (
+        'locator', 'created_at', 'name', 'source_units', 'sorted_source_units',
+        '_sig', '_canonical',
+    )
+    
     def __init__(self, locator: str, created_at: str, project_data: Dict[str, Any]):
         self.locator = locator
         self.created_at = created_at
@@ -100,129 +263,218 @@ class ProjectAnalysis:
         
         for su_data in project_data.get("SourceUnits", []):
             self.source_units.append(DependencyGraph(su_data))
+        
+        # Source units sorted by type, shared by signature and equivalence checks
+        self.sorted_source_units = sorted(self.source_units, key=lambda x: x.type)
+        
+        # Cached signature and canonical key, computed on first use
+        self._sig = None
+        self._canonical = None
     
     def get_signature(self) -> str:
         """Generate a signature for this entire project analysis."""
-        # Sort source units by type and signature for consistent comparison
-        su_signatures = []
-        for su in sorted(self.source_units, key=lambda x: x.type):
-            su_signatures.append(f"{su.type}:{su.get_signature()}")
-        
-        combined = "|".join(su_signatures)
-        return hashlib.sha256(combined.encode()).hexdigest()
+        if self._sig is None:
+            # Sort source units by type and signature for consistent comparison
+            su_signatures = []
+            for su in self.sorted_source_units:
+                su_signatures.append(f"{su.type}:{su.get_signature()}")
+            
+            combined = "|".join(su_signatures)
+            h = new_signature_hasher()
+            h.update(combined.encode())
+            self._sig = signature_hexdigest(h)
+        return self._sig
+    
+    def canonical(self) -> Tuple[Any, ...]:
+        """Return a hashable canonical form of this analysis, usable as a dict key."""
+        if self._canonical is None:
+            self._canonical = tuple(su.canonical() for su in self.sorted_source_units)
+        return self._canonical
     
     def is_equivalent_to(self, other: 'ProjectAnalysis') -> bool:
         """Check if this project analysis is equivalent to another."""
         if len(self.source_units) != len(other.source_units):
             return False
         
-        # Sort both lists by type for comparison
-        self_sorted = sorted(self.source_units, key=lambda x: x.type)
-        other_sorted = sorted(other.source_units, key=lambda x: x.type)
+        # Cheap check on the type mix before comparing graphs
+        if any(
+            su1.type != su2.type
+            for su1, su2 in zip(self.sorted_source_units, other.sorted_source_units)
+        ):
+            return False
         
+        # Compare source units pairwise in type order
         return all(
             su1.is_equivalent_to(su2) 
-            for su1, su2 in zip(self_sorted, other_sorted)
+            for su1, su2 in zip(self.sorted_source_units, other.sorted_source_units)
         )
 
 
-def parse_csv_data(csv_data: str) -> List[ProjectAnalysis]:
-    """Parse CSV data containing dependency graph information."""
-    projects = []
+def _build_project(row: Tuple[int, str, str, str]) -> Tuple[Optional[ProjectAnalysis], Optional[str]]:
+    """Build a ProjectAnalysis from a CSV row. Runs in a worker process."""
+    row_num, locator, created_at, data = row
+    
+    try:
+        # Parse the JSON data
+        project_data = load_project_data(data)
+        return ProjectAnalysis(locator, created_at, project_data), None
+    except JSONDecodeError as e:
+        return None, f"Error parsing JSON in row {row_num}: {e}"
+    except Exception as e:
+        return None, f"Error processing row {row_num}: {e}"
+
+
+def _build_projects(rows: List[Tuple[int, str, str, str]]) -> List[Tuple[Optional[ProjectAnalysis], Optional[str]]]:
+    """Build a batch of ProjectAnalysis objects. Runs in a worker process.
+    
+    Sharing of equal import sets survives the pickle back to the parent only
+    within one batch, so the shared-set table is cleared once the batch is built.
+    """
+    try:
+        return [_build_project(row) for row in rows]
+    finally:
+        _FS_INTERN.clear()
+
+
+def parse_csv_data(csv_lines: Iterable[str]) -> Iterator[ProjectAnalysis]:
+    """Parse CSV data containing dependency graph information.
     
-    # Create a StringIO object from the CSV data
-    csv_file = StringIO(csv_data)
-    reader = csv.reader(csv_file)
+    Accepts any iterable of CSV lines (e.g. an open file or sys.stdin) so rows
+    are streamed rather than read into memory all at once. JSON decoding and
+    graph construction are spread across a process pool, and projects are
+    yielded as they become available.
+    """
+    reader = csv.reader(csv_lines)
     
     # Read header row
-    header = next(reader)
+    header = next(reader, None)
+    if header is None:
+        return
     expected_columns = ["locator", "createdAt", "data"]
     
     # Validate header
     if header != expected_columns:
         print(f"Warning: Expected columns {expected_columns}, got {header}", file=sys.stderr)
     
-    for row_num, row in enumerate(reader, start=2):
-        if len(row) < 3:
-            print(f"Error: Row {row_num} has insufficient columns: {len(row)}", file=sys.stderr)
-            continue
+    def rows() -> Iterator[Tuple[int, str, str, str]]:
+        for row_num, row in enumerate(reader, start=2):
+            if len(row) < 3:
+                print(f"Error: Row {row_num} has insufficient columns: {len(row)}", file=sys.stderr)
+                continue
             
-        locator, created_at, data = row[:3]
-        
-        try:
-            # Parse the JSON data
-            project_data = json.loads(data)
-            projects.append(ProjectAnalysis(locator, created_at, project_data))
-        except json.JSONDecodeError as e:
-            print(f"Error parsing JSON in row {row_num}: {e}", file=sys.stderr)
-            continue
-        except Exception as e:
-            print(f"Error processing row {row_num}: {e}", file=sys.stderr)
-            continue
+            locator, created_at, data = row[:3]
+            yield row_num, locator, created_at, data
     
-    return projects
+    def results(future) -> Iterator[ProjectAnalysis]:
+        for project, error in future.result():
+            if error:
+                print(error, file=sys.stderr)
+                continue
+            yield project
+    
+    # Submit in bounded batches rather than via executor.map, which would
+    # queue the whole input before yielding anything; results come back in
+    # input order
+    max_workers = os.cpu_count() or 1
+    max_pending = max_workers * MAX_PENDING_BATCHES_PER_WORKER
+    row_iter = rows()
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for batch in iter(lambda: list(islice(row_iter, ROW_BATCH_SIZE)), []):
+            pending.append(executor.submit(_build_projects, batch))
+            if len(pending) >= max_pending:
+                yield from results(pending.popleft())
+        while pending:
+            yield from results(pending.popleft())
 
 
-def bucket_projects(projects: List[ProjectAnalysis]) -> Dict[str, List[ProjectAnalysis]]:
-    """Bucket projects by their dependency graph signatures."""
-    buckets = defaultdict(list)
+def bucket_projects(projects: Iterable[ProjectAnalysis]) -> List[List[ProjectAnalysis]]:
+    """Bucket projects by their canonical dependency graph form.
     
+    Buckets are returned as a list rather than keyed by signature so two
+    distinct graphs can never be merged by a digest collision.
+    """
+    # Partition on a cheap pre-key first: projects with a different number or
+    # mix of source unit types can never be equivalent
+    prebuckets = defaultdict(list)
     for project in projects:
-        signature = project.get_signature()
-        buckets[signature].append(project)
+        prekey = (
+            len(project.source_units),
+            tuple(su.type for su in project.sorted_source_units),
+        )
+        prebuckets[prekey].append(project)
     
-    return dict(buckets)
+    # Only build canonical forms where there is more than one candidate; the
+    # hashed signature is only needed once per bucket, for display
+    buckets = []
+    for candidates in prebuckets.values():
+        if len(candidates) == 1:
+            buckets.append(candidates)
+            continue
+        
+        groups = defaultdict(list)
+        for project in candidates:
+            groups[project.canonical()].append(project)
+        buckets.extend(groups.values())
+    
+    return buckets
 
 
+@functools.lru_cache(maxsize=None)
 def format_created_at(created_at_str: str) -> str:
     """Format the created_at timestamp for display."""
     try:
         # Try to parse as ISO format timestamp
         dt = datetime.fromisoformat(created_at_str.replace('Z', '+00:00'))
         return dt.strftime('%Y-%m-%d %H:%M:%S UTC')
-    except:
+    except ValueError:
         # If parsing fails, return as-is
         return created_at_str
 
 
-def print_analysis_report(buckets: Dict[str, List[ProjectAnalysis]]):
+def print_analysis_report(buckets: List[List[ProjectAnalysis]]):
     """Print a detailed analysis report."""
-    print("=" * 100)
-    print("CSV DEPENDENCY GRAPH ANALYSIS REPORT")
-    print("=" * 100)
-    print()
-    
-    print(f"Total unique graph patterns found: {len(buckets)}")
-    print(f"Total project analyses: {sum(len(bucket) for bucket in buckets.values())}")
-    print()
-    
-    # Sort buckets by size (largest first), then by earliest creation time
-    def bucket_sort_key(item):
-        signature, projects = item
-        return (-len(projects), min(p.created_at for p in projects))
-    
-    sorted_buckets = sorted(buckets.items(), key=bucket_sort_key)
-    
-    for i, (signature, projects) in enumerate(sorted_buckets, 1):
-        print(f"BUCKET {i}: {len(projects)} identical analyses")
-        print(f"Graph Signature: {signature}")
-        print("-" * 80)
+    # Collect the report and write it out at once rather than print per line
+    out = []
+    out.append("=" * 100 + "\n")
+    out.append("CSV DEPENDENCY GRAPH ANALYSIS REPORT\n")
+    out.append("=" * 100 + "\n")
+    out.append("\n")
+    
+    out.append(f"Total unique graph patterns found: {len(buckets)}\n")
+    out.append(f"Total project analyses: {sum(len(bucket) for bucket in buckets)}\n")
+    out.append("\n")
+    
+    # Sort buckets by size (largest first), then by earliest creation time,
+    # computing each bucket's key once up front
+    keyed_buckets = [
+        ((-len(projects), min(p.created_at for p in projects)), projects)
+        for projects in buckets
+    ]
+    keyed_buckets.sort(key=lambda item: item[0])
+    sorted_buckets = [projects for _, projects in keyed_buckets]
+    
+    for i, projects in enumerate(sorted_buckets, 1):
+        out.append(f"BUCKET {i}: {len(projects)} identical analyses\n")
+        # The signature is for display only; bucketing uses canonical()
+        out.append(f"Graph Signature: {projects[0].get_signature()}\n")
+        out.append("-" * 80 + "\n")
         
         # Analyze the first project in this bucket for graph details
         sample_project = projects[0]
-        print(f"Sample Project: {sample_project.name}")
-        print(f"Source Units: {len(sample_project.source_units)}")
+        out.append(f"Sample Project: {sample_project.name}\n")
+        out.append(f"Source Units: {len(sample_project.source_units)}\n")
         
         for j, su in enumerate(sample_project.source_units):
             stats = su.get_stats()
-            print(f"  [{j+1}] Type: {su.type}")
-            print(f"      Graph Breadth: {su.graph_breadth}")
-            print(f"      Build Succeeded: {su.build_succeeded}")
-            print(f"      Direct Dependencies: {stats['direct_dependencies']}")
-            print(f"      Total Dependencies: {stats['total_dependencies']}")
-            print(f"      Origin Paths: {su.origin_paths}")
+            out.append(f"  [{j+1}] Type: {su.type}\n")
+            out.append(f"      Graph Breadth: {su.graph_breadth}\n")
+            out.append(f"      Build Succeeded: {su.build_succeeded}\n")
+            out.append(f"      Direct Dependencies: {stats['direct_dependencies']}\n")
+            out.append(f"      Total Dependencies: {stats['total_dependencies']}\n")
+            out.append(f"      Origin Paths: {su.origin_paths}\n")
         
-        print(f"\nAnalyses in this bucket (sorted by creation time):")
+        out.append(f"\nAnalyses in this bucket (sorted by creation time):\n")
         
         # Sort projects by creation time
         sorted_projects = sorted(projects, key=lambda x: x.created_at)
@@ -239,70 +491,74 @@ def print_analysis_report(buckets: Dict[str, List[ProjectAnalysis]]):
             
             formatted_time = format_created_at(project.created_at)
             
-            print(f"  • Locator: {repo_info}")
-            print(f"    Created: {formatted_time}")
-            print(f"    Revision: {revision_info}")
-            print()
+            out.append(f"  • Locator: {repo_info}\n")
+            out.append(f"    Created: {formatted_time}\n")
+            out.append(f"    Revision: {revision_info}\n")
+            out.append("\n")
         
-        print("=" * 100)
-        print()
+        out.append("=" * 100 + "\n")
+        out.append("\n")
+    
+    sys.stdout.write("".join(out))
 
 
-def print_summary_statistics(buckets: Dict[str, List[ProjectAnalysis]]):
+def print_summary_statistics(buckets: List[List[ProjectAnalysis]]):
     """Print summary statistics about the analysis."""
     unique_patterns = len(buckets)
-    total_analyses = sum(len(bucket) for bucket in buckets.values())
+    total_analyses = sum(len(bucket) for bucket in buckets)
+    out = []
     
-    print("SUMMARY STATISTICS")
-    print("=" * 50)
+    out.append("SUMMARY STATISTICS\n")
+    out.append("=" * 50 + "\n")
     
     if unique_patterns == 1:
-        print(f"✓ All {total_analyses} analyses have IDENTICAL dependency graphs!")
+        out.append(f"✓ All {total_analyses} analyses have IDENTICAL dependency graphs!\n")
     elif unique_patterns == total_analyses:
-        print(f"⚠ All {total_analyses} analyses have DIFFERENT dependency graphs!")
+        out.append(f"⚠ All {total_analyses} analyses have DIFFERENT dependency graphs!\n")
     else:
-        print(f"📊 Found {unique_patterns} unique patterns among {total_analyses} analyses")
+        out.append(f"📊 Found {unique_patterns} unique patterns among {total_analyses} analyses\n")
         duplicates = total_analyses - unique_patterns
-        print(f"   {duplicates} analyses are duplicates of others")
+        out.append(f"   {duplicates} analyses are duplicates of others\n")
         
         # Show distribution of bucket sizes
-        bucket_sizes = [len(bucket) for bucket in buckets.values()]
+        bucket_sizes = [len(bucket) for bucket in buckets]
         bucket_sizes.sort(reverse=True)
-        print(f"   Largest bucket: {bucket_sizes[0]} identical analyses")
+        out.append(f"   Largest bucket: {bucket_sizes[0]} identical analyses\n")
         if len(bucket_sizes) > 1:
-            print(f"   Bucket size distribution: {bucket_sizes[:5]}{'...' if len(bucket_sizes) > 5 else ''}")
+            out.append(f"   Bucket size distribution: {bucket_sizes[:5]}{'...' if len(bucket_sizes) > 5 else ''}\n")
     
-    # Time range analysis
-    all_projects = [p for bucket in buckets.values() for p in bucket]
-    if all_projects:
-        timestamps = [p.created_at for p in all_projects]
-        timestamps.sort()
-        print(f"   Time range: {format_created_at(timestamps[0])} to {format_created_at(timestamps[-1])}")
+    # Time range analysis, tracked in a single pass over all projects
+    first_created = last_created = None
+    for bucket in buckets:
+        for p in bucket:
+            if first_created is None or p.created_at < first_created:
+                first_created = p.created_at
+            if last_created is None or p.created_at > last_created:
+                last_created = p.created_at
+    if first_created is not None:
+        out.append(f"   Time range: {format_created_at(first_created)} to {format_created_at(last_created)}\n")
     
-    print()
+    out.append("\n")
+    sys.stdout.write("".join(out))
 
 
 def main():
     """Main entry point."""
+    # Parse and bucket the projects in a single streaming pass
     if len(sys.argv) > 1:
-        # Read from file
-        with open(sys.argv[1], 'r') as f:
-            csv_data = f.read()
+        # Stream from file
+        with open(sys.argv[1], 'r', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            buckets = bucket_projects(parse_csv_data(f))
     else:
-        # Read from stdin
-        csv_data = sys.stdin.read()
-    
-    # Parse the CSV data
-    projects = parse_csv_data(csv_data)
+        # Stream from stdin
+        buckets = bucket_projects(parse_csv_data(sys.stdin))
     
-    if not projects:
+    total_projects = sum(len(bucket) for bucket in buckets)
+    if not total_projects:
         print("No valid project data found.", file=sys.stderr)
         sys.exit(1)
     
-    print(f"Successfully parsed {len(projects)} project analyses from CSV data.\n")
-    
-    # Bucket the projects
-    buckets = bucket_projects(projects)
+    print(f"Successfully parsed {total_projects} project analyses from CSV data.\n")
     
     # Print the detailed analysis report
     print_analysis_report(buckets)
@@ -18,25 +18,82 @@ import sys
 import csv
 import re
 from collections import defaultdict
-from typing import Dict, List, Set, Tuple, Any, Optional
+from typing import Dict, List, Set, FrozenSet, Tuple, Any, Optional
 import hashlib
 from io import StringIO
 from datetime import datetime, timezone
 from dataclasses import dataclass
 import argparse
 import os
+import functools
+import multiprocessing
+import warnings
+from itertools import chain, repeat, zip_longest
 
 try:
     import openpyxl
+    from openpyxl.cell import Cell, WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment
     from openpyxl.utils import get_column_letter
     EXCEL_AVAILABLE = True
 except ImportError:
     EXCEL_AVAILABLE = False
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
 # Increase CSV field size limit
 csv.field_size_limit(10 * 1024 * 1024)
 
+# Rows per chunk when reading the CSV with pandas
+CSV_CHUNK_SIZE = 50000
+
+# Temporary build directory prefix stripped from build environment paths
+_TMP_BUILD_PATH_RE = re.compile(r'/tmp/tmp[^/]+/unpacked/[^/]+/')
+
+# Project locator: custom+<org-id>/<project-title>$<revision>
+_LOCATOR_RE = re.compile(r'^custom\+([^/]+)/([^$]+)\$(.+)$')
+
+# datetime.fromisoformat accepts a trailing 'Z' from Python 3.11
+_FROMISOFORMAT_PARSES_Z = sys.version_info >= (3, 11)
+
+def _new_signature_hasher():
+    """Create a fast 64-bit hasher for signatures (xxh3, or blake2b if xxhash is missing)."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64()
+    return hashlib.blake2b(digest_size=8)
+
+def _signature_intdigest(hasher) -> int:
+    """Return the digest of a signature hasher as an int."""
+    if XXHASH_AVAILABLE:
+        return hasher.intdigest()
+    return int.from_bytes(hasher.digest(), "little")
+
+def _hash_count(hasher, count: int):
+    """Feed a length/count into the hasher so adjacent fields can't run together."""
+    hasher.update(count.to_bytes(4, "little"))
+
+def _hash_str(hasher, value: str):
+    """Feed a length-prefixed UTF-8 string into the hasher."""
+    data = value.encode()
+    _hash_count(hasher, len(data))
+    hasher.update(data)
+
 @dataclass
 class ParsedLocator:
     """Represents a parsed locator with org, project, and revision."""
@@ -49,23 +106,83 @@ class ParsedLocator:
         """Get the project key (org + project) for grouping."""
         return f"{self.org_id}/{self.project_title}"
 
+def _intern(value: Any) -> Any:
+    """Intern string values so each distinct dependency identifier is stored once.
+    
+    sys.intern does not keep strings alive, so worker memory doesn't grow with
+    the file's whole vocabulary.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+def _json_loads(data: str) -> Any:
+    """Decode a JSON document, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def iter_csv_rows(csv_path: str, use_pandas: bool = False):
+    """Yield the CSV header, then (row_num, row) for each data row.
+    
+    csv.reader is used by default so row numbers and counts match the file
+    exactly. With use_pandas, pandas' chunked C parser is used instead: it does
+    not track row numbers, so row_num is None, and each line it drops as
+    malformed is reported and yielded as (None, None) so it still counts.
+    Blank and short lines come back padded with empty fields.
+    """
+    if use_pandas:
+        read_options = dict(dtype=str, engine='c', keep_default_na=False, na_filter=False,
+                            skip_blank_lines=False)
+        yield pd.read_csv(csv_path, nrows=0, **read_options).columns.tolist()
+        reader = pd.read_csv(csv_path, chunksize=CSV_CHUNK_SIZE, on_bad_lines='warn', **read_options)
+        while True:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                chunk = next(reader, None)
+            for w in caught:
+                if not issubclass(w.category, pd.errors.ParserWarning):
+                    warnings.showwarning(w.message, w.category, w.filename, w.lineno)
+                    continue
+                message = str(w.message).strip()
+                print(message, file=sys.stderr)
+                yield from repeat((None, None), message.count('Skipping line'))
+            if chunk is None:
+                return
+            for row in chunk.itertuples(index=False, name=None):
+                yield None, row
+    
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        yield next(reader)
+        yield from enumerate(reader, start=2)
+
 class SourceUnitSignature:
     """Represents a normalized signature for a single source unit."""
     
     def __init__(self, source_unit: Dict[str, Any]):
-        self.origin_paths = sorted([path for path in source_unit.get("OriginPaths", []) if path])
-        self.type = source_unit.get("Type", "")
-        self.build = source_unit.get("Build", {})
-        self.succeeded = self.build.get("Succeeded", False)
+        self.origin_paths = sorted(_intern(path) for path in source_unit.get("OriginPaths", []) if path)
+        self.type = _intern(source_unit.get("Type", ""))
+        # The raw Build tree is not kept, so it isn't pickled back from pool workers
+        build = source_unit.get("Build", {})
+        self.succeeded = build.get("Succeeded", False)
         
         # Extract direct imports (what this source unit imports)
-        raw_imports = self.build.get("Imports", [])
+        raw_imports = build.get("Imports", [])
         self.direct_imports = self._normalize_dependency_list(raw_imports)
         
         # Extract transitive dependencies (dependencies and their imports)
-        raw_deps = self.build.get("Dependencies", [])
+        raw_deps = build.get("Dependencies", [])
         self.transitive_deps = self._normalize_transitive_dependencies(raw_deps)
         
+        # All dependencies (direct + transitive locators + their imports), built once
+        self.all_deps = frozenset(chain(
+            self.direct_imports,
+            self.transitive_deps.keys(),
+            chain.from_iterable(self.transitive_deps.values())
+        ))
+        
+        # Cached on first use; the data above is not modified after construction
+        self._sig = None
+        
     def _normalize_dependency_list(self, deps: List[str]) -> Set[str]:
         """Normalize a list of dependency identifiers."""
         normalized = set()
@@ -74,7 +191,7 @@ class SourceUnitSignature:
                 # Only normalize build environment paths, not dependency identifiers
                 normalized_dep = self._normalize_if_build_path(dep)
                 if normalized_dep:
-                    normalized.add(normalized_dep)
+                    normalized.add(_intern(normalized_dep))
         return normalized
         
     def _normalize_transitive_dependencies(self, deps: List[Any]) -> Dict[str, Set[str]]:
@@ -94,8 +211,8 @@ class SourceUnitSignature:
                             if imp and isinstance(imp, str):
                                 normalized_imp = self._normalize_if_build_path(imp)
                                 if normalized_imp:
-                                    normalized_imports.add(normalized_imp)
-                        normalized[normalized_locator] = normalized_imports
+                                    normalized_imports.add(_intern(normalized_imp))
+                        normalized[_intern(normalized_locator)] = normalized_imports
         
         return normalized
     
@@ -103,46 +220,58 @@ class SourceUnitSignature:
         """Only normalize if this looks like a build environment path."""
         if not path_or_locator:
             return path_or_locator
-            
+        
         # Only normalize paths that look like temporary build paths
         if '/tmp/tmp' in path_or_locator and '/unpacked/' in path_or_locator:
             # Remove temporary directory prefixes
-            normalized = re.sub(r'/tmp/tmp[^/]+/unpacked/[^/]+/', '', path_or_locator)
+            normalized = _TMP_BUILD_PATH_RE.sub('', path_or_locator)
             normalized = normalized.lstrip('/\\')
             return normalized if normalized else path_or_locator
         
         # For dependency locators and normal paths, don't normalize
         return path_or_locator
     
-    def get_all_dependencies(self) -> Set[str]:
+    def get_all_dependencies(self) -> FrozenSet[str]:
         """Get all dependencies (direct + transitive) for this source unit."""
-        all_deps = set(self.direct_imports)
-        
-        # Add transitive dependency locators
-        all_deps.update(self.transitive_deps.keys())
-        
-        # Add imports from transitive dependencies
-        for imports in self.transitive_deps.values():
-            all_deps.update(imports)
-            
-        return all_deps
+        return self.all_deps
     
-    def get_signature(self) -> str:
+    def get_signature(self) -> int:
         """Generate a signature for this source unit based on actual dependencies."""
-        # Create deterministic representation
-        data = {
-            "origin_paths": self.origin_paths,
-            "type": self.type,
-            "build_succeeded": self.succeeded,
-            "direct_imports": sorted(list(self.direct_imports)),
-            "transitive_deps": {
-                locator: sorted(list(imports))
-                for locator, imports in sorted(self.transitive_deps.items())
-            }
-        }
-        
-        json_str = json.dumps(data, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(json_str.encode()).hexdigest()
+        if self._sig is None:
+            self._sig = self._compute_signature()
+        return self._sig
+    
+    def _compute_signature(self) -> int:
+        """Hash a deterministic representation of this source unit."""
+        # Feed a deterministic, length-prefixed encoding of each field
+        hasher = _new_signature_hasher()
+        
+        hasher.update(b"O")
+        _hash_count(hasher, len(self.origin_paths))
+        for path in self.origin_paths:
+            _hash_str(hasher, path)
+        
+        # repr() keeps null, false and "None" apart, as the JSON signature did
+        hasher.update(b"T")
+        _hash_str(hasher, repr(self.type))
+        
+        hasher.update(b"S")
+        _hash_str(hasher, repr(self.succeeded))
+        
+        hasher.update(b"D")
+        _hash_count(hasher, len(self.direct_imports))
+        for dep in sorted(self.direct_imports):
+            _hash_str(hasher, dep)
+        
+        hasher.update(b"R")
+        _hash_count(hasher, len(self.transitive_deps))
+        for locator, imports in sorted(self.transitive_deps.items()):
+            _hash_str(hasher, locator)
+            _hash_count(hasher, len(imports))
+            for imp in sorted(imports):
+                _hash_str(hasher, imp)
+        
+        return _signature_intdigest(hasher)
     
     def is_equivalent_to(self, other: 'SourceUnitSignature') -> bool:
         """Check if this source unit is equivalent to another."""
@@ -175,26 +304,45 @@ class ProjectDependencyGraph:
                 else:
                     # If multiple source units claim the same origin path, this could be an issue
                     print(f"Warning: Multiple source units for origin path {origin_path} in {locator}", file=sys.stderr)
-    
-    def get_signature(self) -> str:
-        """Generate a signature for the entire project dependency graph."""
-        # Create signature based on all origin paths and their dependencies
-        origin_signatures = {}
-        for origin_path, source_unit in sorted(self.source_units_by_origin.items()):
-            origin_signatures[origin_path] = source_unit.get_signature()
-        
-        combined_data = {
-            "origin_signatures": origin_signatures,
-            "origin_paths": sorted(self.source_units_by_origin.keys())
+        
+        # Dependency count summary, computed once
+        total_direct = 0
+        total_transitive_locators = 0
+        total_transitive_imports = 0
+        
+        for source_unit in self.source_units_by_origin.values():
+            total_direct += len(source_unit.direct_imports)
+            total_transitive_locators += len(source_unit.transitive_deps)
+            for imports in source_unit.transitive_deps.values():
+                total_transitive_imports += len(imports)
+        
+        self._summary = {
+            "direct": total_direct,
+            "transitive": total_transitive_locators + total_transitive_imports,
+            "total": total_direct + total_transitive_locators + total_transitive_imports
         }
         
-        json_str = json.dumps(combined_data, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(json_str.encode()).hexdigest()
+        # Cached on first use
+        self._sig = None
+        self._all_deps_flat = None
+    
+    def get_signature(self) -> int:
+        """Generate a signature for the entire project dependency graph."""
+        if self._sig is None:
+            # Create signature based on all origin paths and their source unit signatures
+            hasher = _new_signature_hasher()
+            _hash_count(hasher, len(self.source_units_by_origin))
+            for origin_path, source_unit in sorted(self.source_units_by_origin.items()):
+                _hash_str(hasher, origin_path)
+                hasher.update(source_unit.get_signature().to_bytes(8, "little"))
+            
+            self._sig = _signature_intdigest(hasher)
+        return self._sig
     
     def is_equivalent_to(self, other: 'ProjectDependencyGraph') -> bool:
         """Check if this project dependency graph is equivalent to another."""
         # Must have same set of origin paths
-        if set(self.source_units_by_origin.keys()) != set(other.source_units_by_origin.keys()):
+        if self.source_units_by_origin.keys() != other.source_units_by_origin.keys():
             return False
         
         # For each origin path, source units must be equivalent
@@ -206,37 +354,57 @@ class ProjectDependencyGraph:
         
         return True
     
-    def get_all_dependencies_flat(self) -> Set[str]:
+    def get_all_dependencies_flat(self) -> FrozenSet[str]:
         """Get all dependencies from all source units as a flat set."""
-        all_deps = set()
-        for source_unit in self.source_units_by_origin.values():
-            all_deps.update(source_unit.get_all_dependencies())
-        return all_deps
+        if self._all_deps_flat is None:
+            self._all_deps_flat = frozenset().union(
+                *(source_unit.all_deps for source_unit in self.source_units_by_origin.values())
+            )
+        return self._all_deps_flat
     
     def get_all_dependencies_summary(self) -> Dict[str, int]:
         """Get summary statistics about dependencies in this graph."""
-        total_direct = 0
-        total_transitive_locators = 0
-        total_transitive_imports = 0
+        return self._summary
+    
+    def _dependencies_for_origins(self, origin_paths) -> FrozenSet[str]:
+        """Get all dependencies of the source units at the given origin paths."""
+        return frozenset().union(
+            *(self.source_units_by_origin[origin_path].all_deps for origin_path in origin_paths)
+        )
+    
+    def compare_summary(self, other: 'ProjectDependencyGraph') -> Dict[str, Any]:
+        """Compare this graph with another, returning only equivalence, origin paths and dependency counts.
         
-        for source_unit in self.source_units_by_origin.values():
-            total_direct += len(source_unit.direct_imports)
-            total_transitive_locators += len(source_unit.transitive_deps)
-            for imports in source_unit.transitive_deps.values():
-                total_transitive_imports += len(imports)
+        Use compare_with() when the per-origin-path differences are needed.
+        """
+        origins_self = self.source_units_by_origin.keys()
+        origins_other = other.source_units_by_origin.keys()
+        common_origins = origins_self & origins_other
+        
+        # Dependency set sizes across common origin paths
+        all_deps_self = self._dependencies_for_origins(common_origins)
+        all_deps_other = other._dependencies_for_origins(common_origins)
+        common_count = len(all_deps_self & all_deps_other)
         
         return {
-            "direct": total_direct,
-            "transitive": total_transitive_locators + total_transitive_imports,
-            "total": total_direct + total_transitive_locators + total_transitive_imports
+            "are_equivalent": self.is_equivalent_to(other),
+            "origin_paths_self": origins_self,
+            "origin_paths_other": origins_other,
+            "summary": {
+                "total_dependencies_self": len(all_deps_self),
+                "total_dependencies_other": len(all_deps_other),
+                "common_dependencies": common_count,
+                "unique_to_self": len(all_deps_self) - common_count,
+                "unique_to_other": len(all_deps_other) - common_count
+            }
         }
     
     def compare_with(self, other: 'ProjectDependencyGraph') -> Dict[str, Any]:
         """Compare this graph with another and return detailed differences."""
         comparison = {
             "are_equivalent": self.is_equivalent_to(other),
-            "origin_paths_self": set(self.source_units_by_origin.keys()),
-            "origin_paths_other": set(other.source_units_by_origin.keys()),
+            "origin_paths_self": self.source_units_by_origin.keys(),
+            "origin_paths_other": other.source_units_by_origin.keys(),
             "origin_path_differences": {},
             "summary": {
                 "total_dependencies_self": 0,
@@ -257,29 +425,22 @@ class ProjectDependencyGraph:
             comparison["origin_path_differences"]["only_in_other"] = list(only_in_other)
         
         # Compare dependencies for common origin paths
-        all_deps_self = set()
-        all_deps_other = set()
-        
         for origin_path in common_origins:
-            su_self = self.source_units_by_origin[origin_path]
-            su_other = other.source_units_by_origin[origin_path]
-            
-            deps_self = su_self.get_all_dependencies()
-            deps_other = su_other.get_all_dependencies()
-            
-            all_deps_self.update(deps_self)
-            all_deps_other.update(deps_other)
+            deps_self = self.source_units_by_origin[origin_path].all_deps
+            deps_other = other.source_units_by_origin[origin_path].all_deps
             
             if deps_self != deps_other:
                 comparison["origin_path_differences"][origin_path] = {
-                    "dependencies_self": sorted(list(deps_self)),
-                    "dependencies_other": sorted(list(deps_other)),
-                    "common": sorted(list(deps_self & deps_other)),
-                    "only_in_self": sorted(list(deps_self - deps_other)),
-                    "only_in_other": sorted(list(deps_other - deps_self))
+                    "dependencies_self": sorted(deps_self),
+                    "dependencies_other": sorted(deps_other),
+                    "common": sorted(deps_self & deps_other),
+                    "only_in_self": sorted(deps_self - deps_other),
+                    "only_in_other": sorted(deps_other - deps_self)
                 }
         
-        # Overall summary
+        # Overall summary across common origin paths
+        all_deps_self = self._dependencies_for_origins(common_origins)
+        all_deps_other = other._dependencies_for_origins(common_origins)
         comparison["summary"]["total_dependencies_self"] = len(all_deps_self)
         comparison["summary"]["total_dependencies_other"] = len(all_deps_other)
         comparison["summary"]["common_dependencies"] = all_deps_self & all_deps_other
@@ -288,10 +449,18 @@ class ProjectDependencyGraph:
         
         return comparison
 
+@dataclass
+class AnalysisRecord:
+    """Compact per-analysis entry; only the first record per signature keeps its graph."""
+    signature: int
+    build_id: str
+    created_at: datetime
+    graph: Optional[ProjectDependencyGraph] = None
+
+@functools.lru_cache(maxsize=1 << 16)
 def parse_locator(locator: str) -> Optional[ParsedLocator]:
     """Parse a locator string to extract org, project, and revision."""
-    pattern = r'^custom\+([^/]+)/([^$]+)\$(.+)$'
-    match = re.match(pattern, locator)
+    match = _LOCATOR_RE.match(locator)
     
     if not match:
         return None
@@ -303,12 +472,16 @@ def parse_locator(locator: str) -> Optional[ParsedLocator]:
         original=locator
     )
 
+@functools.lru_cache(maxsize=1 << 15)
 def parse_timestamp(timestamp_str: str) -> datetime:
     """Parse timestamp string to datetime object."""
     try:
         # Handle various timestamp formats
         if timestamp_str.endswith('Z'):
-            return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+            # Dominant shape in exports; parsed natively from Python 3.11
+            if _FROMISOFORMAT_PARSES_Z:
+                return datetime.fromisoformat(timestamp_str)
+            return datetime.fromisoformat(timestamp_str[:-1] + '+00:00')
         elif '+' in timestamp_str and ':' in timestamp_str.split('+')[-1]:
             return datetime.fromisoformat(timestamp_str)
         elif timestamp_str.endswith('+00'):
@@ -317,91 +490,173 @@ def parse_timestamp(timestamp_str: str) -> datetime:
             # Assume UTC if no timezone
             dt = datetime.fromisoformat(timestamp_str.replace('Z', ''))
             return dt.replace(tzinfo=timezone.utc)
-    except:
+    except ValueError:
         return datetime.now(timezone.utc)
 
-def analyze_project_revisions(grouped_data: Dict[str, Dict[str, List[ProjectDependencyGraph]]]) -> Dict[str, Any]:
+def _build_graph(has_build_id: bool, numbered_row: Tuple[Optional[int], Optional[Tuple[str, ...]]]) -> Tuple[Optional[Tuple[str, str, ProjectDependencyGraph]], Optional[str]]:
+    """Build a project dependency graph from one CSV row. Runs in a worker process.
+    
+    Returns ((project_key, revision, graph), None) on success, (None, None) for rows
+    whose locator can't be parsed or that the CSV reader already reported as
+    malformed, and (None, error_message) on failure.
+    """
+    row_num, row = numbered_row
+    if row is None:
+        return None, None
+    if row_num is None and not row[-1]:
+        # pandas pads blank and short lines instead of rejecting them
+        return None, "Error processing row: empty data field (blank or short line)"
+    try:
+        if has_build_id:
+            build_id, locator, created_at, data_json = row
+        else:
+            locator, created_at, data_json = row
+            build_id = ""
+        
+        # Parse data
+        parsed_locator = parse_locator(locator)
+        if not parsed_locator:
+            return None, None
+        
+        parsed_timestamp = parse_timestamp(created_at)
+        project_data = _json_loads(data_json)
+        
+        # Create project dependency graph; hash it here so the cached signature
+        # travels back with the graph instead of being computed in the parent
+        graph = ProjectDependencyGraph(locator, parsed_timestamp, project_data, build_id)
+        graph.get_signature()
+        
+        return (parsed_locator.get_project_key(), parsed_locator.revision, graph), None
+        
+    except Exception as e:
+        if row_num is None:
+            return None, f"Error processing row: {e}"
+        return None, f"Error processing row {row_num}: {e}"
+
+def analyze_project_revisions(grouped_data: Dict[Tuple[str, str], List[AnalysisRecord]]) -> Dict[str, Any]:
     """Analyze projects for alternating dependency graphs within same revisions."""
     results = {
         "high_priority_alternating": [],  # Same revision, different graphs
-        "projects_analyzed": 0,
-        "revisions_analyzed": 0
+        "projects_analyzed": len({project_key for project_key, _ in grouped_data}),
+        "revisions_analyzed": len(grouped_data)
     }
     
-    for project_key, revisions in grouped_data.items():
-        results["projects_analyzed"] += 1
-        
-        for revision, graphs in revisions.items():
-            results["revisions_analyzed"] += 1
+    for (project_key, revision), records in grouped_data.items():
+        if len(records) < 2:
+            continue  # Need at least 2 analyses to compare
+        
+        # Common case: every analysis matches the first
+        first_sig = records[0].signature
+        if all(record.signature == first_sig for record in records[1:]):
+            continue
+        
+        # Group by signature to find alternating patterns
+        signature_groups = defaultdict(list)
+        for record in records:
+            signature_groups[record.signature].append(record)
+        
+        # If multiple signatures for same revision = alternating!
+        if len(signature_groups) > 1:
+            # Sort signatures by frequency and time
+            sorted_signatures = sorted(
+                signature_groups.items(),
+                key=lambda x: (-len(x[1]), min(g.created_at for g in x[1]))
+            )
             
-            if len(graphs) < 2:
-                continue  # Need at least 2 analyses to compare
+            # Collect ALL build IDs and timestamps from all signature groups in one pass,
+            # keeping each group's own lists for the per-signature fields below
+            all_build_ids = []
+            all_timestamps = []
+            group_build_ids = []
+            group_timestamps = []
+            for sig, sig_records in sorted_signatures:
+                build_ids = []
+                timestamps = []
+                for g in sig_records:
+                    build_ids.append(g.build_id)
+                    timestamps.append(g.created_at)
+                group_build_ids.append(build_ids)
+                group_timestamps.append(timestamps)
+                all_build_ids.extend(build_ids)
+                all_timestamps.extend(timestamps)
             
-            # Group by signature to find alternating patterns
-            signature_groups = defaultdict(list)
-            for graph in graphs:
-                signature = graph.get_signature()
-                signature_groups[signature].append(graph)
+            primary_sig, primary_records = sorted_signatures[0]
+            # The first record of each signature holds its sample graph
+            primary_graph = primary_records[0].graph
             
-            # If multiple signatures for same revision = alternating!
-            if len(signature_groups) > 1:
-                # Sort signatures by frequency and time
-                sorted_signatures = sorted(
-                    signature_groups.items(),
-                    key=lambda x: (-len(x[1]), min(g.created_at for g in x[1]))
-                )
-                
-                # Collect ALL build IDs and timestamps from all signature groups
-                all_build_ids = []
-                all_timestamps = []
-                all_comparisons = []
-                
-                primary_sig, primary_graphs = sorted_signatures[0]
-                
-                # Create comparisons with each alternate signature
-                for alt_sig, alt_graphs in sorted_signatures[1:]:
-                    primary_graph = primary_graphs[0]
-                    alt_graph = alt_graphs[0]
-                    comparison = primary_graph.compare_with(alt_graph)
-                    all_comparisons.append({
-                        "alt_signature": alt_sig,
-                        "alt_count": len(alt_graphs),
-                        "alt_build_ids": [g.build_id for g in alt_graphs],
-                        "alt_timestamps": [g.created_at for g in alt_graphs],
-                        "comparison": comparison,
-                        "sample_alt": alt_graph
-                    })
-                
-                # Collect all build IDs and timestamps from all groups
-                for sig, sig_graphs in sorted_signatures:
-                    all_build_ids.extend([g.build_id for g in sig_graphs])
-                    all_timestamps.extend([g.created_at for g in sig_graphs])
-                
-                # Create ONE entry per project-revision with ALL build information
-                results["high_priority_alternating"].append({
-                    "project_key": project_key,
-                    "revision": revision,
-                    "total_analyses": len(graphs),
-                    "signature_count": len(signature_groups),
-                    "all_build_ids": all_build_ids,
-                    "all_timestamps": all_timestamps,
-                    "primary_signature": primary_sig,
-                    "primary_count": len(primary_graphs),
-                    "primary_build_ids": [g.build_id for g in primary_graphs],
-                    "primary_timestamps": [g.created_at for g in primary_graphs],
-                    "sample_primary": primary_graphs[0],
-                    "all_comparisons": all_comparisons,
-                    # Keep first alternate for backward compatibility with Excel generation
-                    "alt_signature": all_comparisons[0]["alt_signature"],
-                    "alt_count": all_comparisons[0]["alt_count"],
-                    "alt_build_ids": all_comparisons[0]["alt_build_ids"],
-                    "alt_timestamps": all_comparisons[0]["alt_timestamps"],
-                    "comparison": all_comparisons[0]["comparison"],
-                    "sample_alt": all_comparisons[0]["sample_alt"]
+            # Create comparisons with each alternate signature
+            all_comparisons = []
+            for k, (alt_sig, alt_records) in enumerate(sorted_signatures[1:], 1):
+                alt_graph = alt_records[0].graph
+                # Only the summary is kept; call compare_with() for per-origin details
+                comparison = primary_graph.compare_summary(alt_graph)
+                all_comparisons.append({
+                    "alt_signature": alt_sig,
+                    "alt_count": len(alt_records),
+                    "alt_build_ids": group_build_ids[k],
+                    "alt_timestamps": group_timestamps[k],
+                    "comparison": comparison,
+                    "sample_alt": alt_graph
                 })
+            
+            # Create ONE entry per project-revision with ALL build information
+            results["high_priority_alternating"].append({
+                "project_key": project_key,
+                "revision": revision,
+                "total_analyses": len(records),
+                "signature_count": len(signature_groups),
+                "all_build_ids": all_build_ids,
+                "all_timestamps": all_timestamps,
+                "primary_signature": primary_sig,
+                "primary_count": len(primary_records),
+                "primary_build_ids": group_build_ids[0],
+                "primary_timestamps": group_timestamps[0],
+                "sample_primary": primary_graph,
+                "all_comparisons": all_comparisons,
+                # Keep first alternate for backward compatibility with Excel generation
+                "alt_signature": all_comparisons[0]["alt_signature"],
+                "alt_count": all_comparisons[0]["alt_count"],
+                "alt_build_ids": all_comparisons[0]["alt_build_ids"],
+                "alt_timestamps": all_comparisons[0]["alt_timestamps"],
+                "comparison": all_comparisons[0]["comparison"],
+                "sample_alt": all_comparisons[0]["sample_alt"]
+            })
     
     return results
 
+def _styled_cell(ws, value, font=None, fill=None, alignment=None):
+    """Create a write-only cell with the given styles applied."""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+def _add_sheet_row(rows: List[List[Any]], col_max_len: List[int], values: List[Any]):
+    """Buffer a row for a sheet, updating the running max value length per column."""
+    for col, value in enumerate(values):
+        if isinstance(value, Cell):
+            value = value.value
+        if value is not None:
+            col_max_len[col] = max(col_max_len[col], len(str(value)))
+    rows.append(values)
+
+def _write_sheet_rows(ws, rows: List[List[Any]], col_max_len: List[int], max_width: int):
+    """Set column widths from the tracked lengths, then stream the rows to a write-only sheet.
+    
+    Write-only sheets emit column widths before the first row, so rows are
+    buffered until the widths are known.
+    """
+    for col, length in enumerate(col_max_len, 1):
+        if length:
+            ws.column_dimensions[get_column_letter(col)].width = min(length + 2, max_width)
+    
+    for row_values in rows:
+        ws.append(row_values)
+
 def create_excel_report_v2(analysis: Dict[str, Any], output_path: str):
     """Create improved Excel report with better organization and accurate dependency data."""
     if not EXCEL_AVAILABLE:
@@ -412,8 +667,8 @@ def create_excel_report_v2(analysis: Dict[str, Any], output_path: str):
         print("No alternating dependency graphs found. No Excel file created.")
         return
     
-    wb = openpyxl.Workbook()
-    wb.remove(wb.active)  # Remove default sheet
+    # Write-only mode streams rows to the XML writer instead of building Cell objects per sheet
+    wb = openpyxl.Workbook(write_only=True)
     
     # Style definitions
     header_font = Font(bold=True, color="FFFFFF")
@@ -424,26 +679,27 @@ def create_excel_report_v2(analysis: Dict[str, Any], output_path: str):
     
     # Create summary sheet
     summary_ws = wb.create_sheet(title="Summary")
+    summary_rows = []
+    summary_col_max_len = [0] * 6
+    add_summary_row = functools.partial(_add_sheet_row, summary_rows, summary_col_max_len)
     
     # Summary header
-    summary_ws.merge_cells('A1:F1')
-    summary_ws['A1'] = "Same Revision Alternating Dependency Graphs Analysis"
-    summary_ws['A1'].font = Font(bold=True, size=16)
-    summary_ws['A1'].alignment = center_align
+    summary_ws.merged_cells.add('A1:F1')
+    add_summary_row([_styled_cell(summary_ws, "Same Revision Alternating Dependency Graphs Analysis",
+                                  font=Font(bold=True, size=16), alignment=center_align)])
+    add_summary_row([])
     
-    summary_ws['A3'] = f"Total alternating revisions: {len(analysis['high_priority_alternating'])}"
-    summary_ws['A4'] = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    add_summary_row([f"Total alternating revisions: {len(analysis['high_priority_alternating'])}"])
+    add_summary_row([f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
+    add_summary_row([])
     
     # Summary table
-    row = 6
     headers = ["Project", "Revision", "Total Scans", "Unique Signatures", "Build IDs", "Time Range"]
-    for col, header in enumerate(headers, 1):
-        cell = summary_ws.cell(row=row, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = center_align
+    add_summary_row([
+        _styled_cell(summary_ws, header, font=header_font, fill=header_fill, alignment=center_align)
+        for header in headers
+    ])
     
-    row += 1
     for item in analysis['high_priority_alternating']:
         # Use the comprehensive all_build_ids that includes ALL builds from ALL signature groups
         all_build_ids = item['all_build_ids']
@@ -459,46 +715,31 @@ def create_excel_report_v2(analysis: Dict[str, Any], output_path: str):
             time_range
         ]
         
-        for col, value in enumerate(data, 1):
-            summary_ws.cell(row=row, column=col, value=str(value))
-        row += 1
-    
-    # Auto-adjust columns
-    for column in summary_ws.columns:
-        max_length = 0
-        column_letter = get_column_letter(column[0].column)
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        summary_ws.column_dimensions[column_letter].width = adjusted_width
+        add_summary_row([str(value) for value in data])
+    
+    _write_sheet_rows(summary_ws, summary_rows, summary_col_max_len, 50)
     
     # Create detailed analysis sheet
     details_ws = wb.create_sheet(title="Detailed Analysis")
+    details_rows = []
+    details_col_max_len = [0] * 6
+    add_details_row = functools.partial(_add_sheet_row, details_rows, details_col_max_len)
     
     # Details header
-    details_ws.merge_cells('A1:F1')
-    details_ws['A1'] = "Detailed Dependency Graph Comparisons"
-    details_ws['A1'].font = Font(bold=True, size=14)
-    details_ws['A1'].alignment = center_align
+    details_ws.merged_cells.add('A1:F1')
+    add_details_row([_styled_cell(details_ws, "Detailed Dependency Graph Comparisons",
+                                  font=Font(bold=True, size=14), alignment=center_align)])
+    add_details_row([])
     
-    row = 3
     for i, item in enumerate(analysis['high_priority_alternating']):
         # Project header
-        details_ws.merge_cells(f'A{row}:F{row}')
-        details_ws[f'A{row}'] = f"Project {i+1}: {item['project_key']}"
-        details_ws[f'A{row}'].font = Font(bold=True, size=12)
-        details_ws[f'A{row}'].fill = header_fill
-        details_ws[f'A{row}'].font = Font(bold=True, color="FFFFFF")
-        row += 1
+        row = len(details_rows) + 1
+        details_ws.merged_cells.add(f'A{row}:F{row}')
+        add_details_row([_styled_cell(details_ws, f"Project {i+1}: {item['project_key']}",
+                                      font=header_font, fill=header_fill)])
         
         # Revision info
-        details_ws[f'A{row}'] = f"Revision: {item['revision']}"
-        details_ws[f'A{row}'].font = Font(bold=True)
-        row += 1
+        add_details_row([_styled_cell(details_ws, f"Revision: {item['revision']}", font=Font(bold=True))])
         
         # Get sample graphs for better naming
         sample_graph1 = item['sample_primary']
@@ -513,22 +754,16 @@ def create_excel_report_v2(analysis: Dict[str, Any], output_path: str):
         deps2 = sample_graph2.get_all_dependencies_summary()
         
         # Graph comparison info with timestamps - keep the preferred naming format
-        details_ws[f'A{row}'] = f"Graph from {time1} (Build ID: {sample_graph1.build_id}) - {deps1['total']} total deps ({deps1['direct']} direct, {deps1['transitive']} transitive)"
-        details_ws[f'A{row}'].fill = graph1_fill
-        
         # Add related builds in adjacent cell
         if item['primary_count'] > 1:
             other_primary_builds = [f"Build {bid} ({ts})" for bid, ts in zip(item['primary_build_ids'], item['primary_timestamps']) if bid != sample_graph1.build_id]
             related_info = f"Related builds with same graph: {', '.join(other_primary_builds)}"
         else:
             related_info = "Only build with this graph signature"
-        details_ws[f'B{row}'] = related_info
-        details_ws[f'B{row}'].fill = graph1_fill
-        details_ws[f'B{row}'].font = Font(italic=True)
-        row += 1
-        
-        details_ws[f'A{row}'] = f"Graph from {time2} (Build ID: {sample_graph2.build_id}) - {deps2['total']} total deps ({deps2['direct']} direct, {deps2['transitive']} transitive)"
-        details_ws[f'A{row}'].fill = graph2_fill
+        add_details_row([
+            _styled_cell(details_ws, f"Graph from {time1} (Build ID: {sample_graph1.build_id}) - {deps1['total']} total deps ({deps1['direct']} direct, {deps1['transitive']} transitive)", fill=graph1_fill),
+            _styled_cell(details_ws, related_info, font=Font(italic=True), fill=graph1_fill)
+        ])
         
         # Add related builds in adjacent cell
         if item['alt_count'] > 1:
@@ -536,78 +771,56 @@ def create_excel_report_v2(analysis: Dict[str, Any], output_path: str):
             related_info = f"Related builds with same graph: {', '.join(other_alt_builds)}"
         else:
             related_info = "Only build with this graph signature"
-        details_ws[f'B{row}'] = related_info
-        details_ws[f'B{row}'].fill = graph2_fill
-        details_ws[f'B{row}'].font = Font(italic=True)
-        row += 1
+        add_details_row([
+            _styled_cell(details_ws, f"Graph from {time2} (Build ID: {sample_graph2.build_id}) - {deps2['total']} total deps ({deps2['direct']} direct, {deps2['transitive']} transitive)", fill=graph2_fill),
+            _styled_cell(details_ws, related_info, font=Font(italic=True), fill=graph2_fill)
+        ])
         
         # Get all dependencies from both graphs for accurate comparison
         all_deps1 = sample_graph1.get_all_dependencies_flat()
         all_deps2 = sample_graph2.get_all_dependencies_flat()
         
-        common_deps = sorted(list(all_deps1 & all_deps2))
-        unique_to_graph1 = sorted(list(all_deps1 - all_deps2))
-        unique_to_graph2 = sorted(list(all_deps2 - all_deps1))
+        common_deps = sorted(all_deps1 & all_deps2)
+        unique_to_graph1 = sorted(all_deps1 - all_deps2)
+        unique_to_graph2 = sorted(all_deps2 - all_deps1)
         
         # Dependencies comparison headers  
-        details_ws[f'A{row}'] = "Common Dependencies"
-        details_ws[f'B{row}'] = f"Only in Graph Type 1"
-        details_ws[f'C{row}'] = f"Only in Graph Type 2"
-        for col in ['A', 'B', 'C']:
-            details_ws[f'{col}{row}'].font = header_font
-            details_ws[f'{col}{row}'].fill = header_fill
-        row += 1
-        
-        # Dependency lists
-        max_deps = max(len(common_deps), len(unique_to_graph1), len(unique_to_graph2), 1)
-        
-        for i in range(max_deps):
-            if i < len(common_deps):
-                details_ws[f'A{row + i}'] = common_deps[i]
-            if i < len(unique_to_graph1):
-                cell = details_ws[f'B{row + i}']
-                cell.value = unique_to_graph1[i]
-                cell.fill = graph1_fill
-            if i < len(unique_to_graph2):
-                cell = details_ws[f'C{row + i}']
-                cell.value = unique_to_graph2[i]
-                cell.fill = graph2_fill
+        add_details_row([
+            _styled_cell(details_ws, header, font=header_font, fill=header_fill)
+            for header in ["Common Dependencies", "Only in Graph Type 1", "Only in Graph Type 2"]
+        ])
+        
+        # Dependency lists side by side
+        dep_rows = list(zip_longest(common_deps, unique_to_graph1, unique_to_graph2))
+        if not dep_rows:
+            dep_rows = [(None, None, None)]  # Keep one row even when both graphs are empty
+        
+        for common, only1, only2 in dep_rows:
+            add_details_row([
+                common,
+                _styled_cell(details_ws, only1, fill=graph1_fill) if only1 is not None else None,
+                _styled_cell(details_ws, only2, fill=graph2_fill) if only2 is not None else None
+            ])
         
         # Add origin path breakdown if different
-        row += max_deps + 1
-        details_ws[f'A{row}'] = "Origin Path Analysis:"
-        details_ws[f'A{row}'].font = Font(bold=True)
-        row += 1
+        add_details_row([])
+        add_details_row([_styled_cell(details_ws, "Origin Path Analysis:", font=Font(bold=True))])
         
-        origins1 = set(sample_graph1.source_units_by_origin.keys())
-        origins2 = set(sample_graph2.source_units_by_origin.keys())
+        origins1 = sample_graph1.source_units_by_origin.keys()
+        origins2 = sample_graph2.source_units_by_origin.keys()
         
         if origins1 != origins2:
-            details_ws[f'A{row}'] = f"Different origin paths detected!"
-            details_ws[f'A{row}'].font = Font(color="FF0000", bold=True)
-            row += 1
-            details_ws[f'A{row}'] = f"Graph 1 origins: {sorted(list(origins1))}"
-            row += 1
-            details_ws[f'A{row}'] = f"Graph 2 origins: {sorted(list(origins2))}"
-            row += 1
+            add_details_row([_styled_cell(details_ws, f"Different origin paths detected!", font=Font(color="FF0000", bold=True))])
+            add_details_row([f"Graph 1 origins: {sorted(origins1)}"])
+            add_details_row([f"Graph 2 origins: {sorted(origins2)}"])
         else:
-            details_ws[f'A{row}'] = f"Same origin paths: {sorted(list(origins1))}"
-            row += 1
-        
-        row += 2  # Add spacing between projects
-    
-    # Auto-adjust columns for details sheet
-    for column in details_ws.columns:
-        max_length = 0
-        column_letter = get_column_letter(column[0].column)
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 80)
-        details_ws.column_dimensions[column_letter].width = adjusted_width
+            add_details_row([f"Same origin paths: {sorted(origins1)}"])
+        
+        # Add spacing between projects
+        add_details_row([])
+        add_details_row([])
+    
+    _write_sheet_rows(details_ws, details_rows, details_col_max_len, 80)
     
     wb.save(output_path)
     print(f"Excel report saved to: {output_path}")
@@ -616,6 +829,8 @@ def main():
     parser = argparse.ArgumentParser(description="Analyze CSV dependency graph data for alternating patterns")
     parser.add_argument("csv_file", help="Path to CSV file containing dependency graph data")
     parser.add_argument("--excel", help="Generate Excel report to specified path")
+    parser.add_argument("--fast-csv", action="store_true",
+                        help="Read the CSV with pandas (faster on large files; errors are reported without row numbers)")
     args = parser.parse_args()
     
     if not os.path.exists(args.csv_file):
@@ -623,58 +838,62 @@ def main():
         return 1
     
     # Parse CSV data
-    grouped_data = defaultdict(lambda: defaultdict(list))
+    grouped_data: Dict[Tuple[str, str], List[AnalysisRecord]] = defaultdict(list)
+    seen_sigs: Dict[Tuple[str, str], Set[int]] = defaultdict(set)
     total_rows = 0
     parsed_rows = 0
     
     print("Parsing CSV data...")
     
-    with open(args.csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        header = next(reader)
-        print(f"Detected header: {header}")
-        
-        # Determine column indices
-        if len(header) == 4:
-            build_id_col, locator_col, created_at_col, data_col = 0, 1, 2, 3
-            has_build_id = True
-        elif len(header) == 3:
-            locator_col, created_at_col, data_col = 0, 1, 2
-            has_build_id = False
-        else:
-            print(f"Error: Expected 3 or 4 columns, got {len(header)}", file=sys.stderr)
-            return 1
-        
-        for row_num, row in enumerate(reader, start=2):
+    use_pandas = args.fast_csv and PANDAS_AVAILABLE
+    if args.fast_csv and not PANDAS_AVAILABLE:
+        print("Warning: pandas package not available, reading CSV with csv module. Install with: pip install pandas", file=sys.stderr)
+    
+    rows = iter_csv_rows(args.csv_file, use_pandas)
+    header = next(rows)
+    print(f"Detected header: {header}")
+    
+    # Determine column indices
+    if len(header) == 4:
+        build_id_col, locator_col, created_at_col, data_col = 0, 1, 2, 3
+        has_build_id = True
+    elif len(header) == 3:
+        locator_col, created_at_col, data_col = 0, 1, 2
+        has_build_id = False
+    else:
+        print(f"Error: Expected 3 or 4 columns, got {len(header)}", file=sys.stderr)
+        return 1
+    
+    # Decode rows and build graphs in parallel; imap keeps input order so the
+    # grouping (and therefore the report) stays deterministic
+    build_graph = functools.partial(_build_graph, has_build_id)
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        for result, error in pool.imap(build_graph, rows, chunksize=256):
             total_rows += 1
             
-            try:
-                if has_build_id:
-                    build_id, locator, created_at, data_json = row
-                else:
-                    locator, created_at, data_json = row
-                    build_id = ""
-                
-                # Parse data
-                parsed_locator = parse_locator(locator)
-                if not parsed_locator:
-                    continue
-                
-                parsed_timestamp = parse_timestamp(created_at)
-                project_data = json.loads(data_json)
-                
-                # Create project dependency graph
-                graph = ProjectDependencyGraph(locator, parsed_timestamp, project_data, build_id)
-                
-                # Group by project and revision
-                project_key = parsed_locator.get_project_key()
-                revision = parsed_locator.revision
-                grouped_data[project_key][revision].append(graph)
-                
-                parsed_rows += 1
-                
-            except Exception as e:
-                print(f"Error processing row {row_num}: {e}", file=sys.stderr)
+            if error:
+                print(error, file=sys.stderr)
+                continue
+            if result is None:
+                continue
+            
+            # Group by project and revision
+            project_key, revision, graph = result
+            group_key = (project_key, revision)
+            sig = graph.get_signature()
+            # Only the first graph per signature is kept as a sample; the rest
+            # are reduced to the fields the report needs
+            seen = seen_sigs[group_key]
+            if sig in seen:
+                sample = None
+            else:
+                seen.add(sig)
+                sample = graph
+            grouped_data[group_key].append(
+                AnalysisRecord(sig, graph.build_id, graph.created_at, sample)
+            )
+            
+            parsed_rows += 1
     
     print(f"Successfully parsed {parsed_rows}/{total_rows} project analyses from CSV data.")
     